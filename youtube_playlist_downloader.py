@@ -13,40 +13,126 @@ Usage:
     
 Options:
     --url, -u URL          Specify playlist URL directly
-    --use-default, -d      Use hardcoded default URL for testing
-    
+    --use-default, -d      Use hardcoded default playlist URL for testing
+    --single-video, -s     Use hardcoded default single video URL for testing
+    --jobs, -j N           Number of fragments to download in parallel
+    --container, -c FMT    Output container: mp4 (default) or mkv
+
 Examples:
     python youtube_playlist_downloader.py --use-default
     python youtube_playlist_downloader.py --url "https://www.youtube.com/playlist?list=YOUR_ID"
 """
 
 import os
+import re
 import sys
+import time
+import shutil
+import tempfile
+import functools
 import subprocess
 import argparse
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import yt_dlp
+except ImportError:
+    yt_dlp = None  # Fall back to invoking yt-dlp as a subprocess
+
+# Temporary per-format fragment files (e.g. "Title.f135.mp4") left behind by yt-dlp
+TEMP_SUFFIX_RE = re.compile(r'\.f\d+\.(mp4|m4a|webm|mkv)$')
+
+# Phrases marking a video yt-dlp skipped rather than failed on; checked before
+# the generic error match because real lines read "ERROR: ... Video unavailable"
+_SKIP_PHRASES = r'video unavailable|private video|blocked|terminated|copyright'
+SKIP_RE = re.compile(_SKIP_PHRASES, re.IGNORECASE)
+
+# Classify a yt-dlp output line in a single pass; the matched group name tells
+# us whether it's a skipped video, an error, or ordinary progress
+CLASSIFY = re.compile(
+    r'(?P<skip>' + _SKIP_PHRASES + r')'
+    r'|(?P<err>error:)'
+    r'|(?P<prog>downloading|finished|extracting|%|playlist)',
+    re.IGNORECASE)
+
+# Bytes twins, applied to raw pipe output before any UTF-8 decode
+SKIP_BYTES = re.compile(_SKIP_PHRASES.encode('ascii'), re.IGNORECASE)
+CLASSIFY_BYTES = re.compile(CLASSIFY.pattern.encode('ascii'), re.IGNORECASE)
+
+# Anything on a YouTube domain counts as a valid URL for the interactive prompt
+YT_URL_RE = re.compile(r'(youtube\.com|youtu\.be)/')
+
+# A list= query parameter marks a playlist, wherever it appears in the URL
+URL_KIND = re.compile(r'[?&]list=([^&]+)')
+
+def is_playlist(url):
+    """Return True if the URL refers to a playlist rather than a single video."""
+    return bool(URL_KIND.search(url))
+
+# Extra files that should be removed after download (everything except final
+# videos); .info.json is double-barrelled so it gets its own endswith check
+UNWANTED_EXTENSIONS = frozenset({
+    '.description',     # Description files
+    '.jpg',             # Thumbnail images
+    '.jpeg',            # Thumbnail images
+    '.png',             # Thumbnail images
+    '.webp',            # Thumbnail images
+    '.m4a',             # Audio-only files
+    '.srt',             # Subtitle files
+    '.vtt'              # Subtitle files
+})
+
+@functools.lru_cache(maxsize=None)
+def _which_cached(name):
+    """shutil.which with the PATH walk done at most once per tool per run."""
+    return shutil.which(name)
+
+def _cache_dir():
+    """Directory for this tool's cache files (prompt history etc.)."""
+    return os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+
+def _probe_version(argv):
+    """Return the first line of `argv`'s version output, or None if it fails.
+
+    Deliberately uncached: this probe goes through an interpreter, so the
+    answer depends on site-packages content that no binary mtime tracks, and
+    a stale "installed" answer would mask the exact failure the install
+    check exists to catch.
+    """
+    try:
+        result = subprocess.run(argv, capture_output=True, text=True, check=True)
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return None
+    return result.stdout.strip().splitlines()[0] if result.stdout.strip() else ''
 
 def check_ytdlp_installed():
     """Check if yt-dlp is installed and accessible."""
-    try:
-        result = subprocess.run(['python', '-m', 'yt_dlp', '--version'], 
-                              capture_output=True, text=True, check=True)
-        print(f"✓ yt-dlp version: {result.stdout.strip()}")
+    if yt_dlp is not None:
+        print(f"✓ yt-dlp version: {yt_dlp.version.__version__}")
         return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        print("❌ Error: yt-dlp is not installed or not accessible.")
-        print("Please install it using: pip install yt-dlp")
-        return False
+    # Not importable in this interpreter - a PATH hit is proof enough, no
+    # need to fork a --version probe just to confirm existence
+    path = _which_cached('yt-dlp')
+    if path is not None:
+        print(f"✓ yt-dlp detected at {path}")
+        return True
+    # Last resort: the module form may still work under the python on PATH
+    version = _probe_version(['python', '-m', 'yt_dlp', '--version'])
+    if version is not None:
+        print(f"✓ yt-dlp version: {version}")
+        return True
+    print("❌ Error: yt-dlp is not installed or not accessible.")
+    print("Please install it using: pip install yt-dlp")
+    return False
 
 def create_download_directory():
     """Create the videos directory on Desktop if it doesn't exist."""
-    desktop_path = Path.home() / "Desktop"
-    videos_path = desktop_path / "videos"
-    
+    videos_path = os.path.join(os.path.expanduser('~'), 'Desktop', 'videos')
+
     try:
-        videos_path.mkdir(parents=True, exist_ok=True)
+        os.makedirs(videos_path, exist_ok=True)
         print(f"✓ Download directory ready: {videos_path}")
-        return str(videos_path)
+        return videos_path
     except Exception as e:
         print(f"❌ Error creating directory {videos_path}: {e}")
         return None
@@ -59,7 +145,7 @@ def get_video_url(args=None):
     
     # Check if URL provided as command line argument
     if args and args.url:
-        url_type = "single video" if "watch?v=" in args.url else "playlist"
+        url_type = "playlist" if is_playlist(args.url) else "single video"
         print(f"Using {url_type} URL from command line: {args.url}")
         return args.url
     
@@ -73,124 +159,241 @@ def get_video_url(args=None):
         print(f"Using hardcoded playlist URL: {default_playlist_url}")
         return default_playlist_url
     
-    # Interactive mode - ask user for input
+    # Interactive mode - ask user for input, with line editing and history
+    # across runs so long URLs can be recalled instead of re-pasted
+    history_file = os.path.join(_cache_dir(), 'yt_dl_history')
+    try:
+        import readline
+        try:
+            readline.read_history_file(history_file)
+        except OSError:
+            pass  # No history yet
+    except ImportError:
+        readline = None  # e.g. Windows without pyreadline
+
+    def _accept(url):
+        if readline is not None:
+            try:
+                os.makedirs(os.path.dirname(history_file), exist_ok=True)
+                readline.write_history_file(history_file)
+            except OSError:
+                pass  # History is best-effort
+        return url
+
     print(f"\n💡 Tip: You can use --url <URL>, --use-default (playlist), or --single-video to skip this prompt")
     print(f"Default playlist URL: {default_playlist_url}")
     print(f"Default single video URL: {default_video_url}")
-    
+
     while True:
         user_input = input("\nEnter YouTube URL (playlist or single video, or press Enter for default playlist): ").strip()
-        
+
         # If user pressed Enter without input, use default playlist
         if not user_input:
             print(f"Using default playlist URL: {default_playlist_url}")
             return default_playlist_url
-            
+
         # Accept any YouTube URL (playlist or single video)
-        if "youtube.com" in user_input or "youtu.be" in user_input:
-            return user_input
+        if YT_URL_RE.search(user_input):
+            return _accept(user_input)
         else:
             print("⚠️  Warning: This doesn't appear to be a YouTube URL.")
             confirm = input("Continue anyway? (y/n): ").strip().lower()
             if confirm in ['y', 'yes']:
-                return user_input
+                return _accept(user_input)
             else:
                 continue
 
+def _inode_of(path):
+    """Sort key for deletion order; files that vanished sort first."""
+    try:
+        return os.stat(path).st_ino
+    except OSError:
+        return 0
+
+def _safe_unlink(path):
+    """Remove a single file, returning 1 on success and 0 if it couldn't be removed."""
+    try:
+        os.unlink(path)
+        return 1
+    except OSError:
+        return 0  # Ignore if we can't remove the file
+
 def cleanup_temp_files(directory):
     """Remove all extra files, keeping only final MP4 videos."""
-    import glob
-    
-    # Patterns for files that should be removed (everything except .mp4, .mkv, .webm)
-    unwanted_patterns = [
-        '*.f*.mp4',         # Separate video files (e.g., f135.mp4)
-        '*.f*.m4a',         # Separate audio files (e.g., f140.m4a)
-        '*.f*.webm',        # Separate webm files
-        '*.f*.mkv',         # Separate mkv files
-        '*.info.json',      # Info JSON files
-        '*.description',    # Description files
-        '*.jpg',            # Thumbnail images
-        '*.jpeg',           # Thumbnail images
-        '*.png',            # Thumbnail images
-        '*.webp',           # Thumbnail images
-        '*.m4a',            # Audio-only files
-        '*.srt',            # Subtitle files
-        '*.vtt'             # Subtitle files
-    ]
-    
+    # Read the directory once and classify each entry by suffix, instead of
+    # re-globbing the same directory once per pattern
+    with os.scandir(directory) as it:
+        entries = [entry for entry in it if entry.is_file()]
+    names = {entry.name for entry in entries}
+
+    temp_victims = []
+    other_victims = []
+    for entry in entries:
+        name = entry.name
+        # Remove temporary format files (e.g., .f135.mp4) only if merged version exists
+        has_merged = False
+        if TEMP_SUFFIX_RE.search(name):
+            stem = name.split('.f', 1)[0]
+            has_merged = stem + '.mp4' in names or stem + '.mkv' in names
+        if has_merged:
+            temp_victims.append(entry.path)
+        # Then remove all other unwanted files; one hash probe on the extension
+        # instead of iterating every suffix per file
+        elif name.endswith('.info.json') or os.path.splitext(name)[1] in UNWANTED_EXTENSIONS:
+            other_victims.append(entry.path)
+
     cleaned_count = 0
     total_cleaned = 0
-    
-    # First, remove temporary format files only if merged version exists
-    temp_patterns = ['*.f*.mp4', '*.f*.m4a', '*.f*.webm', '*.f*.mkv']
-    for pattern in temp_patterns:
-        temp_files = glob.glob(os.path.join(directory, pattern))
-        for temp_file in temp_files:
-            # Check if there's a corresponding merged file
-            base_name = os.path.basename(temp_file)
-            # Remove the format code (e.g., .f135.mp4 -> .mp4)
-            merged_name = base_name.split('.f')[0] + '.mp4'
-            merged_path = os.path.join(directory, merged_name)
-            
-            # Only remove temp file if merged version exists
-            if os.path.exists(merged_path):
-                try:
-                    os.remove(temp_file)
-                    cleaned_count += 1
-                except OSError:
-                    pass  # Ignore if we can't remove the file
-    
-    # Then remove all other unwanted files
-    other_patterns = ['*.info.json', '*.description', '*.jpg', '*.jpeg', 
-                     '*.png', '*.webp', '*.m4a', '*.srt', '*.vtt']
-    for pattern in other_patterns:
-        unwanted_files = glob.glob(os.path.join(directory, pattern))
-        for unwanted_file in unwanted_files:
-            try:
-                os.remove(unwanted_file)
-                total_cleaned += 1
-            except OSError:
-                pass  # Ignore if we can't remove the file
-    
+    if temp_victims or other_victims:
+        # For large batches, unlink in inode order so directory-block access
+        # stays sequential instead of thrashing the directory B-tree
+        if len(temp_victims) + len(other_victims) > 64:
+            temp_victims.sort(key=_inode_of)
+            other_victims.sort(key=_inode_of)
+        # Dispatch the unlinks across threads so the kernel can service them
+        # in parallel; each deletion is latency-bound on its syscall
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+            cleaned_count = sum(executor.map(_safe_unlink, temp_victims))
+            total_cleaned = sum(executor.map(_safe_unlink, other_victims))
+
     if cleaned_count > 0 or total_cleaned > 0:
         print(f"🧹 Cleaned up {cleaned_count + total_cleaned} extra files (keeping only MP4 videos)")
 
 def check_ffmpeg():
     """Check if ffmpeg is available."""
-    try:
-        result = subprocess.run(['ffmpeg', '-version'], 
-                              capture_output=True, text=True, check=True)
+    if _which_cached('ffmpeg') is not None:
         print(f"✓ ffmpeg is available")
         return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        print("⚠️  ffmpeg not found. Using single-file format selection...")
-        return False
+    print("⚠️  ffmpeg not found. Using single-file format selection...")
+    return False
 
-def download_video_or_playlist(url, output_dir):
-    """Download video(s) using yt-dlp with specified options."""
-    # Determine if it's a single video or playlist
-    is_single_video = "watch?v=" in url and "list=" not in url
-    content_type = "single video" if is_single_video else "playlist"
-    
-    print(f"\n🚀 Starting download...")
-    print(f"📂 Saving to: {output_dir}")
-    print(f"🔗 {content_type.title()}: {url}")
-    print("-" * 60)
-    
-    # Check for ffmpeg
-    has_ffmpeg = check_ffmpeg()
-    
-    # Use best single file format to avoid ffmpeg requirement
-    # Adjust output path based on content type
-    if is_single_video:
-        output_template = f'{output_dir}/Single Videos/%(title)s.%(ext)s'
+def _download_with_api(url, output_template, output_dir, has_ffmpeg, is_single_video, jobs,
+                       container, temp_dir):
+    """Download in-process through the yt-dlp Python API (no interpreter fork)."""
+    counters = {'skipped': 0, 'errors': 0}
+
+    def _hook(d):
+        status = d.get('status')
+        if status == 'finished':
+            filename = os.path.basename(d.get('filename', ''))
+            print(f"   Finished: {filename}")
+        elif status == 'error':
+            counters['errors'] += 1
+
+    class _Logger:
+        """Filter yt-dlp's messages like the subprocess path filters stdout.
+
+        With ignoreerrors, unavailable/private videos fail during extraction
+        and never reach the progress hooks; they only surface as error()
+        calls here, so this is where skips get counted.
+        """
+
+        def debug(self, msg):
+            match = CLASSIFY.search(msg)
+            if match and match.lastgroup == 'prog':
+                print(f"   {msg}")
+
+        info = debug
+
+        def warning(self, msg):
+            pass
+
+        def error(self, msg):
+            if SKIP_RE.search(msg):
+                counters['skipped'] += 1
+                print(f"   ⏭️  Skipped: {msg}")
+            else:
+                counters['errors'] += 1
+                print(f"   ⚠️  {msg}")
+
+    ydl_opts = {
+        'outtmpl': output_template,
+        # Final files under output_dir, fragments in the ephemeral temp dir
+        'paths': {'home': output_dir, 'temp': temp_dir},
+        # Don't write sidecar files we would only delete again afterwards
+        'writeinfojson': False,
+        'writedescription': False,
+        'writethumbnail': False,
+        'writesubtitles': False,
+        'keepvideo': False,
+        'ignoreerrors': True,  # Skip unavailable videos
+        'continuedl': True,
+        'overwrites': False,
+        'skip_unavailable_fragments': True,  # Skip broken fragments
+        'concurrent_fragment_downloads': jobs,
+        'noplaylist': is_single_video,
+        # Start the first download while later entries are still being
+        # discovered, instead of enumerating the whole playlist up front
+        'lazy_playlist': not is_single_video,
+        'progress_hooks': [_hook],
+        'logger': _Logger(),
+    }
+    if has_ffmpeg:
+        # Same format selection as the subprocess path, in option form;
+        # Matroska output can take any codec, so drop the mp4/m4a preference
+        if container == 'mkv':
+            ydl_opts['format'] = 'bv*+ba/b'
+        else:
+            ydl_opts['format'] = 'bv*[ext=mp4]+ba[ext=m4a]/bv*+ba/b'
+        ydl_opts['merge_output_format'] = container
+        ydl_opts['postprocessor_args'] = {'merger': ['-c', 'copy']}
+        # Stream HLS through ffmpeg so fragments feed the muxer directly
+        # instead of being written to disk and re-read
+        ydl_opts['external_downloader'] = {'m3u8': 'ffmpeg'}
+        ydl_opts['hls_use_mpegts'] = True
+        ydl_opts['external_downloader_args'] = {'ffmpeg_i': ['-thread_queue_size', '1024']}
     else:
-        output_template = f'{output_dir}/%(playlist_title)s/%(title)s.%(ext)s'
-    
+        ydl_opts['format'] = 'best[ext=mp4]/best'
+
+    print("📥 Download progress:")
+    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+        returncode = ydl.download([url])
+
+    if counters['skipped'] > 0:
+        print(f"\n📊 Skipped {counters['skipped']} unavailable/private videos")
+    return returncode, counters['skipped']
+
+def _download_with_subprocess(url, output_template, output_dir, has_ffmpeg, is_single_video,
+                              jobs, container, temp_dir):
+    """Download by spawning yt-dlp as a subprocess and parsing its output."""
+    if has_ffmpeg:
+        # Separate video+audio streams are smaller than pre-muxed files and
+        # unlock resolutions above 720p; "-c copy" makes ffmpeg stream-copy
+        # during the merge instead of re-encoding. Matroska output can take
+        # any codec, so drop the mp4/m4a preference there
+        format_args = [
+            '--format', 'bv*+ba/b' if container == 'mkv' else 'bv*[ext=mp4]+ba[ext=m4a]/bv*+ba/b',
+            '--merge-output-format', container,
+            '--postprocessor-args', 'Merger:-c copy',
+            # Stream HLS through ffmpeg so fragments feed the muxer directly
+            # instead of being written to disk and re-read
+            '--downloader', 'm3u8:ffmpeg',
+            '--hls-use-mpegts',
+            '--downloader-args', 'ffmpeg_i:-thread_queue_size 1024',
+        ]
+    else:
+        format_args = ['--format', 'best[ext=mp4]/best']  # Single file format
+
+    # Invoke whatever check_ytdlp_installed found: the standalone binary when
+    # it's on PATH, else the module form under the python on PATH
+    ytdlp_path = _which_cached('yt-dlp')
+    ytdlp_argv = [ytdlp_path] if ytdlp_path else ['python', '-m', 'yt_dlp']
+
     cmd = [
-        'python', '-m', 'yt_dlp',
-        '--format', 'best[ext=mp4]/best',  # Single file format
+        *ytdlp_argv,
+        *format_args,
+        '--concurrent-fragments', str(jobs),  # Download DASH/HLS fragments in parallel
+        '--newline',  # Progress as \n-terminated lines; binary iteration splits on \n only
         '--output', output_template,
+        # Final files under output_dir, fragments in the ephemeral temp dir
+        '--paths', 'home:' + output_dir,
+        '--paths', 'temp:' + temp_dir,
+        # Don't write sidecar files we would only delete again afterwards
+        '--no-write-info-json',
+        '--no-write-description',
+        '--no-write-thumbnail',
+        '--no-write-subs',
+        '--no-keep-video',
         '--ignore-errors',  # Skip unavailable videos
         '--continue',
         '--no-overwrites',
@@ -201,64 +404,136 @@ def download_video_or_playlist(url, output_dir):
         url
     ]
     
-    # Add playlist-specific options only for playlists
+    # Add playlist-specific options only for playlists; --lazy-playlist starts
+    # the first download while later entries are still being discovered
     if not is_single_video:
-        cmd.insert(-1, '--yes-playlist')
-    
+        cmd[-1:-1] = ['--yes-playlist', '--lazy-playlist']
+
+    # Run yt-dlp with real-time output; keep the pipe binary so uninteresting
+    # lines (the vast majority, e.g. progress-bar redraws) are never decoded
+    process = subprocess.Popen(cmd, stdout=subprocess.PIPE,
+                             stderr=subprocess.STDOUT)
+
+    print("📥 Download progress:")
+    skipped_count = 0
+    error_count = 0
+
+    # Batch output lines so verbose downloads cost one write syscall per
+    # chunk instead of a formatted, flushing print per line
+    buf = []
+    last_flush = time.monotonic()
+
+    def _flush():
+        nonlocal last_flush
+        if buf:
+            sys.stdout.write('\n'.join(buf) + '\n')
+            sys.stdout.flush()
+            buf.clear()
+        last_flush = time.monotonic()
+
     try:
-        # Run yt-dlp with real-time output
-        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, 
-                                 stderr=subprocess.STDOUT, 
-                                 universal_newlines=True, bufsize=1)
-        
-        print("📥 Download progress:")
-        skipped_count = 0
-        error_count = 0
-        
-        for line in process.stdout:
-            # Print progress lines that contain useful information
-            line = line.strip()
-            if line:
-                # Count skipped/error videos
-                if any(skip_phrase in line.lower() for skip_phrase in 
-                      ['video unavailable', 'private video', 'blocked', 'terminated', 'copyright']):
-                    skipped_count += 1
-                    print(f"   ⏭️  Skipped: {line}")
-                elif 'error:' in line.lower():
-                    error_count += 1
-                    print(f"   ⚠️  {line}")
-                elif any(keyword in line.lower() for keyword in 
-                        ['downloading', 'finished', 'extracting', '%', 'playlist']):
-                    print(f"   {line}")
-        
-        if skipped_count > 0:
-            print(f"\n📊 Skipped {skipped_count} unavailable/private videos")
-        
-        process.wait()
-        
-        # Check if any files were actually downloaded and clean up
-        playlist_dirs = [d for d in os.listdir(output_dir) if os.path.isdir(os.path.join(output_dir, d))]
-        
+        for raw in process.stdout:
+            raw = raw.strip()
+            if not raw:
+                continue
+            match = CLASSIFY_BYTES.search(raw)
+            if not match:
+                continue
+            # Only lines worth printing reach the UTF-8 decoder
+            line = raw.decode('utf-8', 'replace')
+            # Count skipped/error videos; "ERROR: ... Video unavailable" lines
+            # match err leftmost but count as skips, like the baseline
+            kind = match.lastgroup
+            if kind == 'err' and SKIP_BYTES.search(raw):
+                kind = 'skip'
+            if kind == 'skip':
+                skipped_count += 1
+                buf.append(f"   ⏭️  Skipped: {line}")
+            elif kind == 'err':
+                error_count += 1
+                buf.append(f"   ⚠️  {line}")
+            else:
+                buf.append(f"   {line}")
+            if len(buf) >= 64 or time.monotonic() - last_flush > 0.05:
+                _flush()
+    finally:
+        _flush()
+
+    if skipped_count > 0:
+        print(f"\n📊 Skipped {skipped_count} unavailable/private videos")
+
+    process.wait()
+    return process.returncode, skipped_count
+
+def download_video_or_playlist(url, output_dir, jobs=None, container='mp4', playlist=None):
+    """Download video(s) using yt-dlp with specified options.
+
+    `playlist` says whether the URL is a playlist; when None it's derived
+    from the URL via is_playlist().
+    """
+    if jobs is None:
+        jobs = min(4, os.cpu_count() or 1)
+    if playlist is None:
+        playlist = is_playlist(url)
+    is_single_video = not playlist
+    content_type = "single video" if is_single_video else "playlist"
+
+    print(f"\n🚀 Starting download...")
+    print(f"📂 Saving to: {output_dir}")
+    print(f"🔗 {content_type.title()}: {url}")
+    print("-" * 60)
+
+    # Check for ffmpeg
+    has_ffmpeg = check_ffmpeg()
+
+    # Adjust output path based on content type. The template must stay
+    # relative: yt-dlp ignores --paths (including the temp dir) whenever the
+    # rendered output filename is absolute, so the destination directory is
+    # passed separately as the "home" path
+    if is_single_video:
+        output_template = 'Single Videos/%(title)s.%(ext)s'
+    else:
+        output_template = '%(playlist_title)s/%(title)s.%(ext)s'
+
+    # Fragments land here and never touch the final directory; removed wholesale below
+    temp_dir = tempfile.mkdtemp(prefix='ytdl_frag_')
+    try:
+        if yt_dlp is not None:
+            # Calling the API in-process skips a full interpreter fork and re-import
+            returncode, skipped_count = _download_with_api(
+                url, output_template, output_dir, has_ffmpeg, is_single_video, jobs,
+                container, temp_dir)
+        else:
+            returncode, skipped_count = _download_with_subprocess(
+                url, output_template, output_dir, has_ffmpeg, is_single_video, jobs,
+                container, temp_dir)
+
+        # Check if any files were actually downloaded and clean up; scandir's
+        # DirEntry carries the type bits, so no extra stat per entry
+        with os.scandir(output_dir) as it:
+            playlist_dirs = [entry.path for entry in it if entry.is_dir()]
+
         if playlist_dirs:
-            playlist_dir = os.path.join(output_dir, playlist_dirs[0])
-            
+            playlist_dir = playlist_dirs[0]
+
             # Clean up temporary files before counting
             cleanup_temp_files(playlist_dir)
-            
-            downloaded_files = [f for f in os.listdir(playlist_dir) 
-                              if f.endswith(('.mp4', '.mkv', '.webm'))]
-            
+
+            with os.scandir(playlist_dir) as it:
+                downloaded_files = [entry.name for entry in it
+                                    if entry.is_file() and entry.name.endswith(('.mp4', '.mkv', '.webm'))]
+
             if downloaded_files:
                 print(f"\n✅ Download completed! Found {len(downloaded_files)} video files")
                 print(f"📁 Files saved in: {playlist_dir}")
                 return True
         
-        if process.returncode == 0:
+        if returncode == 0:
             print("\n✅ Download process completed successfully!")
             print(f"📁 Check files in: {output_dir}")
             return True
         else:
-            print(f"\n⚠️  Download process finished with exit code: {process.returncode}")
+            print(f"\n⚠️  Download process finished with exit code: {returncode}")
             print("💡 Some videos may have downloaded successfully despite errors")
             print(f"📁 Check files in: {output_dir}")
             return True  # Don't fail completely if some files downloaded
@@ -269,6 +544,8 @@ def download_video_or_playlist(url, output_dir):
     except Exception as e:
         print(f"\n❌ Unexpected error during download: {e}")
         return False
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
 
 def main():
     """Main function to orchestrate the download process."""
@@ -289,7 +566,11 @@ def main():
                        help='Use the hardcoded default playlist URL for testing')
     parser.add_argument('--single-video', '-s', action='store_true',
                        help='Use the hardcoded default single video URL for testing')
-    
+    parser.add_argument('--jobs', '-j', type=int, default=min(4, os.cpu_count() or 1),
+                       help='Number of fragments to download in parallel (default: %(default)s)')
+    parser.add_argument('--container', '-c', choices=['mp4', 'mkv'], default='mp4',
+                       help='Output container; mkv muxes much faster on large videos (default: %(default)s)')
+
     args = parser.parse_args()
     
     print("🎬 YouTube Video/Playlist Downloader")
@@ -312,7 +593,10 @@ def main():
         return 0
     
     # Download the video(s)
-    success = download_video_or_playlist(video_url, output_dir)
+    # Classify the URL once and pass the result down explicitly
+    success = download_video_or_playlist(video_url, output_dir, jobs=args.jobs,
+                                         container=args.container,
+                                         playlist=is_playlist(video_url))
     
     if success:
         print("\n🎉 All done! Enjoy your videos!")